@@ -15,24 +15,39 @@ YELLOW='\033[1;33m'
 RED='\033[0;31m'
 NC='\033[0m'
 
+# Function to write a log line to the terminal and the log file (builtins only, no date/tee forks)
+write_log() {
+    local stamp
+    printf -v stamp '%(%Y-%m-%d %H:%M:%S)T' -1
+    local line="${1}[${stamp}]${2}${NC} $3"
+    echo -e "$line"
+    echo -e "$line" >> "$LOG_FILE"
+}
+
 # Function to log messages
 log_message() {
-    echo -e "${GREEN}[$(date '+%Y-%m-%d %H:%M:%S')]${NC} $1" | tee -a "$LOG_FILE"
+    write_log "$GREEN" "" "$1"
 }
 
 log_warning() {
-    echo -e "${YELLOW}[$(date '+%Y-%m-%d %H:%M:%S')] WARNING:${NC} $1" | tee -a "$LOG_FILE"
+    write_log "$YELLOW" " WARNING:" "$1"
 }
 
 log_error() {
-    echo -e "${RED}[$(date '+%Y-%m-%d %H:%M:%S')] ERROR:${NC} $1" | tee -a "$LOG_FILE"
+    write_log "$RED" " ERROR:" "$1"
+}
+
+# Function to check if the PID in the lock file is alive (shell builtins only, no cat/ps forks)
+lock_pid_running() {
+    PID=""
+    read -r PID < "$LOCK_FILE" 2>/dev/null
+    [ -n "$PID" ] && kill -0 "$PID" 2>/dev/null
 }
 
 # Function to check if service is already running
 check_lock() {
     if [ -f "$LOCK_FILE" ]; then
-        PID=$(cat "$LOCK_FILE" 2>/dev/null)
-        if ps -p "$PID" > /dev/null 2>&1; then
+        if lock_pid_running; then
             log_warning "Service already running with PID $PID"
             return 1
         else
@@ -118,8 +133,7 @@ show_status() {
     echo ""
     
     if [ -f "$LOCK_FILE" ]; then
-        PID=$(cat "$LOCK_FILE" 2>/dev/null)
-        if ps -p "$PID" > /dev/null 2>&1; then
+        if lock_pid_running; then
             echo "✅ Service is RUNNING (PID: $PID)"
         else
             echo "❌ Service has stale lock file"
@@ -186,8 +200,7 @@ main() {
         
         "stop")
             if [ -f "$LOCK_FILE" ]; then
-                PID=$(cat "$LOCK_FILE" 2>/dev/null)
-                if ps -p "$PID" > /dev/null 2>&1; then
+                if lock_pid_running; then
                     log_message "Stopping background service (PID: $PID)"
                     kill "$PID"
                     remove_lock
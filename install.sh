@@ -22,7 +22,7 @@ elif pip install --break-system-packages -r requirements.txt; then
     echo "✅ Dependencies installed (system packages)"
 else
     echo "❌ Failed to install dependencies. Please install manually:"
-    echo "   pip install httpx aiofiles beautifulsoup4 jinja2 curl-cffi lxml"
+    echo "   pip install 'httpx[http2,brotli]' beautifulsoup4 jinja2 curl-cffi lxml"
     exit 1
 fi
 
@@ -20,6 +20,10 @@ CACHE_DIR="$SCRIPT_DIR/.cache_v7_final"
 REQUIREMENTS_FILE="$SCRIPT_DIR/requirements.txt"
 MAIN_SCRIPT="$SCRIPT_DIR/racing_scanner.py"
 
+# Platform never changes during a run, so probe for Termux once
+IS_TERMUX=0
+[ -d "/data/data/com.termux" ] && IS_TERMUX=1
+
 # Function to print colored output
 print_status() {
     echo -e "${BLUE}[INFO]${NC} $1"
@@ -44,7 +48,7 @@ command_exists() {
 
 # Function to check Termux environment
 check_termux() {
-    if [ -d "/data/data/com.termux" ]; then
+    if [ "$IS_TERMUX" -eq 1 ]; then
         print_success "Running in Termux environment"
         return 0
     else
@@ -154,14 +158,17 @@ run_scanner() {
 open_report() {
     print_status "Looking for generated report..."
     
-    # Find the most recent HTML report
-    LATEST_REPORT=$(find "$OUTPUT_DIR" -name "racing_report_*.html" -type f -printf '%T@ %p\n' | sort -n | tail -1 | cut -f2- -d" ")
+    # Find the most recent HTML report. Names carry a YYYYmmdd_HHMMSS stamp, so the
+    # glob's lexical order is already chronological and no stat/sort pipeline is needed.
+    local reports=("$OUTPUT_DIR"/racing_report_*.html)
+    LATEST_REPORT=""
+    [ -f "${reports[${#reports[@]}-1]}" ] && LATEST_REPORT="${reports[${#reports[@]}-1]}"
     
     if [ -n "$LATEST_REPORT" ]; then
         print_success "Found report: $LATEST_REPORT"
         
         # Copy to shared storage for easy access
-        if check_termux; then
+        if [ "$IS_TERMUX" -eq 1 ]; then
             SHARED_DIR="/sdcard/Download/RacingScanner"
             mkdir -p "$SHARED_DIR"
             cp "$LATEST_REPORT" "$SHARED_DIR/"
@@ -24,6 +24,7 @@ CONFIG = {
     "HTTP": {
         "REQUEST_TIMEOUT": 30.0,
         "MAX_CONCURRENT_REQUESTS": 12,
+        "MAX_CONCURRENT_PER_HOST": 4,
         "MAX_RETRIES": 3,
         "RETRY_BACKOFF_BASE": 2,
         "USER_AGENTS": [
@@ -36,7 +37,8 @@ CONFIG = {
     "CACHE": {
         "DEFAULT_TTL": 1800,      # 30 minutes for normal fetches
         "MANUAL_FETCH_TTL": 21600, # 6 hours for hard-to-get manual fetches
-        "ENABLED": True
+        "ENABLED": True,
+        "MEMORY_MAX_CHARS": 4_000_000  # in-process LRU of disk-cache hits, capped by total characters
     },
 
     # Data Sources (All sources enabled for maximum coverage)
@@ -82,6 +84,27 @@ CONFIG = {
 # ENHANCED HTML TEMPLATE
 # =============================================================================
 
+# One race card, rendered once per race and reused by every tab that lists it.
+RACE_CARD_TEMPLATE = """
+    <div class="race {{ race.discipline }}" data-score="{{ race.value_score }}">
+        <div class="head">
+            <span style="font-size:1.3em">{{ race.course }}</span>
+            <span class="pill">{{ race.country }}</span>
+            <span class="pill">{{ race.local_time }} {{ race.timezone_name }}</span>
+            <span class="pill value-score-pill {% if race.value_score >= 90 %}value-score-90plus{% elif race.value_score >= 80 %}value-score-80plus{% elif race.value_score >= 70 %}value-score-70plus{% elif race.value_score >= 60 %}value-score-60plus{% endif %}">
+                {{ "%.0f"|format(race.value_score) }}★
+            </span>
+        </div>
+        <div class="favorites-row">
+            <div class="favorite-info"><div class="favorite-name">🥇 {{ (race.favorite.name or 'Unknown') if race.favorite else 'N/A' }}</div><div class="favorite-odds">{{ (race.favorite.odds_str or 'SP') if race.favorite else '' }}</div></div>
+            <div class="favorite-info"><div class="favorite-name">🥈 {{ (race.second_favorite.name or 'Unknown') if race.second_favorite else 'N/A' }}</div><div class="favorite-odds">{{ (race.second_favorite.odds_str or 'SP') if race.second_favorite else '' }}</div></div>
+        </div>
+        <div class="runner-count"><strong>Field:</strong> {{ race.field_size }} runners</div>
+        <div class="data-sources"><strong>Sources:</strong>{% for source in race.source_labels %}<span class="source-pill">{{ source }}</span>{% endfor %}</div>
+        <div class="links"><a href="{{ race.race_url }}" target="_blank" rel="noopener">📋 Racecard</a>{% if race.form_guide_url %}<a class="alt" href="{{ race.form_guide_url }}" target="_blank" rel="noopener">📊 Form</a>{% endif %}</div>
+    </div>
+    """
+
 HTML_TEMPLATE = """
 <!doctype html>
 <html lang="en">
@@ -157,25 +180,6 @@ HTML_TEMPLATE = """
         <div class="tab" onclick="showTab('value-races', this)">🔥 High Value ({{ value_races | length }})</div>
         <div class="tab" onclick="showTab('all-races', this)">📋 All Races ({{ all_races | length }})</div>
     </div>
-    {% macro render_race(race) %}
-    <div class="race {{ race.discipline }}" data-score="{{ race.value_score }}">
-        <div class="head">
-            <span style="font-size:1.3em">{{ race.course }}</span>
-            <span class="pill">{{ race.country }}</span>
-            <span class="pill">{{ race.local_time }} {{ race.timezone_name }}</span>
-            <span class="pill value-score-pill {% if race.value_score >= 90 %}value-score-90plus{% elif race.value_score >= 80 %}value-score-80plus{% elif race.value_score >= 70 %}value-score-70plus{% elif race.value_score >= 60 %}value-score-60plus{% endif %}">
-                {{ "%.0f"|format(race.value_score) }}★
-            </span>
-        </div>
-        <div class="favorites-row">
-            <div class="favorite-info"><div class="favorite-name">🥇 {{ (race.favorite.name or 'Unknown') if race.favorite else 'N/A' }}</div><div class="favorite-odds">{{ (race.favorite.odds_str or 'SP') if race.favorite else '' }}</div></div>
-            <div class="favorite-info"><div class="favorite-name">🥈 {{ (race.second_favorite.name or 'Unknown') if race.second_favorite else 'N/A' }}</div><div class="favorite-odds">{{ (race.second_favorite.odds_str or 'SP') if race.second_favorite else '' }}</div></div>
-        </div>
-        <div class="runner-count"><strong>Field:</strong> {{ race.field_size }} runners</div>
-        <div class="data-sources"><strong>Sources:</strong>{% for source in race.data_sources.values() | unique | sort %}<span class="source-pill">{{ source.upper() }}</span>{% endfor %}</div>
-        <div class="links"><a href="{{ race.race_url }}" target="_blank" rel="noopener">📋 Racecard</a>{% if race.form_guide_url %}<a class="alt" href="{{ race.form_guide_url }}" target="_blank" rel="noopener">📊 Form</a>{% endif %}</div>
-    </div>
-    {% endmacro %}
     <div id="filtered-races" class="tab-content active"><h2>🎯 Superfecta Fields ({{ min_runners }}-{{ max_runners }} Runners)</h2>{% for race in filtered_races %}{{ render_race(race) }}{% endfor %}</div>
     <div id="value-races" class="tab-content"><h2>🔥 Premium Value Opportunities (Score 70+)</h2>{% for race in value_races %}{{ render_race(race) }}{% endfor %}</div>
     <div id="all-races" class="tab-content"><h2>📋 Complete Race List (by Score)</h2>{% for race in all_races %}{{ render_race(race) }}{% endfor %}</div>
@@ -228,16 +232,19 @@ import logging
 import os
 import re
 import hashlib
+import heapq
 import random
 import sys
 import time
-import webbrowser
 import csv
-from dataclasses import dataclass, asdict, field
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, field, fields
+from datetime import datetime, time as dtime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urlsplit, urljoin
 
 try:
     from zoneinfo import ZoneInfo
@@ -250,11 +257,27 @@ except ImportError:
     print("Error: Jinja2 is not installed. Please run: pip install Jinja2", file=sys.stderr)
     sys.exit(1)
 
-import aiofiles
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from curl_cffi.requests import AsyncSession as CurlCffiSession
 import httpx
 
+try:
+    import lxml  # noqa: F401
+    # lxml is a C tokenizer and parses several times faster than html.parser
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # =============================================================================
 # DATA CLASSES AND CORE MODELS
 # =============================================================================
@@ -267,7 +290,11 @@ class SourceError:
     timestamp: datetime
     url: Optional[str] = None
 
-@dataclass
+# RaceData is created once per race from every source, so drop the per-instance
+# __dict__ where the interpreter supports it (dataclass slots need 3.10+).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class RaceData:
     id: str
     course: str
@@ -286,6 +313,16 @@ class RaceData:
     value_score: float = 0.0
     data_sources: Dict[str, str] = field(default_factory=dict)
 
+    @property
+    def source_labels(self) -> Tuple[str, ...]:
+        """Distinct upper-cased source names, sorted case-insensitively like Jinja's sort filter."""
+        return _source_labels(frozenset(self.data_sources.values()))
+
+# Races share a handful of source combinations, so the labels are computed once per combination.
+@lru_cache(maxsize=256)
+def _source_labels(sources: frozenset) -> Tuple[str, ...]:
+    return tuple(sorted({s.upper() for s in sources}, key=str.lower))
+
 @dataclass
 class ScanStatistics:
     total_races_found: int = 0
@@ -298,23 +335,73 @@ class ScanStatistics:
 # UTILITY FUNCTIONS
 # =============================================================================
 
+# Patterns used on every race/row are compiled once here rather than per call.
+RE_PAREN = re.compile(r'\s*\([^)]*\)')
+RE_HHMM = re.compile(r"\b(\d{1,2}):(\d{2})\s*([AaPp][Mm])?\b")
+RE_META_REFRESH = re.compile(r'http-equiv=["\']?refresh["\']?[^>]*content=["\']?\s*\d+\s*;\s*url=([^"\'>\s]+)', re.I)
+RE_CAPTION_TIME = re.compile(r'^\d{2}:\d{2}')
+RE_PANEL_CLASS = re.compile(r'\bpanel\b')
+RE_RUNNERS = re.compile(r'(\d+)\s+runners?', re.I)
+RE_COUNTRY = re.compile(r'\(([^)]+)\)')
+RE_URL_DATE = re.compile(r"/(\d{4}-\d{2}-\d{2})")
+
+# Index and meeting pages only need a few tag types; strainers skip building the rest of the tree.
+ANCHOR_STRAINER = SoupStrainer("a", href=True)
+HRA_MEETING_STRAINER = SoupStrainer(["h1", "h2", "a"])
+STDCAN_MEETING_STRAINER = SoupStrainer(["h1", "h2", "section"])
+# No real field is this large; stray or nested tables beyond it are not walked.
+MAX_FIELD_ROWS = 30
+
+@lru_cache(maxsize=1024)
 def normalize_course_name(name: str) -> str:
     """Aggressively normalize course name for consistent comparison."""
     if not name: return ""
-    normalized = re.sub(r'\s*\([^)]*\)', '', name.lower().strip())
+    normalized = RE_PAREN.sub('', name.lower().strip())
     replacements = {'park': '', 'raceway': '', 'racecourse': '', 'track': '', 'stadium': '', 'greyhound': '', 'harness': ''}
     for old, new in replacements.items():
         normalized = normalized.replace(old, new)
     return " ".join(normalized.split())
 
+@lru_cache(maxsize=1024)
+def course_slug(name: str) -> str:
+    """URL slug for a course: normalized name with whitespace runs joined by hyphens."""
+    return "-".join(normalize_course_name(name).split())
+
+@lru_cache(maxsize=512)
+def course_from_slug(slug: str) -> str:
+    """Display name from a URL slug; slugs repeat for every race at a meeting."""
+    return slug.replace("-", " ").title()
+
+@lru_cache(maxsize=64)
+def _zoneinfo(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+UTC = _zoneinfo("UTC")
+
+@lru_cache(maxsize=1440)
+def hhmm_to_time(hhmm: str) -> dtime:
+    """Parse an 'HH:MM' race time with integer splits instead of strptime."""
+    hh, _, mm = hhmm.partition(":")
+    return dtime(int(hh), int(mm))
+
+def format_hhmm(dt: datetime) -> str:
+    """Zero-padded HH:MM from the time fields, skipping strftime's format scanner."""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+# Races at one meeting share a course; the timezone tables are fixed once CONFIG is loaded.
+@lru_cache(maxsize=1024)
 def get_track_timezone(course: str, country: str) -> str:
-    norm_course = normalize_course_name(course).replace(" ", "-")
+    norm_course = course_slug(course)
     return CONFIG["TIMEZONES"]["TRACKS"].get(norm_course, CONFIG["TIMEZONES"]["COUNTRIES"].get(country.upper(), "UTC"))
 
 def generate_race_id(course: str, date: str, time: str) -> str:
-    key = f"{normalize_course_name(course)}|{date}|{re.sub(r'[^\d]', '', time or '')}"
-    return hashlib.sha1(key.encode()).hexdigest()[:12]
+    digits = (time or "").replace(":", "")
+    if not digits.isdecimal(): digits = "".join(filter(str.isdecimal, digits))
+    key = f"{normalize_course_name(course)}|{date}|{digits}"
+    return hashlib.blake2b(key.encode(), digest_size=6).hexdigest()
 
+# Odds strings repeat heavily ("2/1", "EVS", ...) and are re-scored per race.
+@lru_cache(maxsize=4096)
 def convert_odds_to_fractional(odds_str: str) -> float:
     if not isinstance(odds_str, str) or not odds_str.strip(): return 999.0
     s = odds_str.strip().upper().replace("-", "/")
@@ -330,6 +417,42 @@ def convert_odds_to_fractional(odds_str: str) -> float:
         return dec - 1.0 if dec > 1 else 999.0
     except ValueError: return 999.0
 
+NO_FAVORITE: Dict[str, str] = {}
+
+def _odds_key(runner: Dict[str, str]) -> float:
+    return convert_odds_to_fractional(runner.get("odds_str", ""))
+
+def _iter_panel_nodes(root: Tag):
+    """Yield (node, nearest enclosing panel div or None) for each <h2>/<caption> in document order, in one top-down walk."""
+    stack = [(iter(root.children), None)]
+    while stack:
+        children, panel = stack[-1]
+        if (child := next((c for c in children if isinstance(c, Tag)), None)) is None: stack.pop(); continue
+        if child.name in ('h2', 'caption'): yield child, panel
+        if child.name == 'div' and any(RE_PANEL_CLASS.search(c) for c in child.get('class') or ()): stack.append((iter(child.children), child))
+        else: stack.append((iter(child.children), panel))
+
+def _json_default(obj: Any) -> str:
+    if isinstance(obj, datetime): return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dump_json_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize compactly (or indented when pretty), using orjson when it is installed; datetimes become ISO strings either way."""
+    if orjson is not None: return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty: return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_json_default).encode("utf-8")
+
+def run_async(coro: Any) -> Any:
+    """Run a coroutine to completion, on uvloop's libuv event loop when it is installed."""
+    if uvloop is not None:
+        if hasattr(uvloop, "run"): return uvloop.run(coro)
+        uvloop.install()  # uvloop < 0.18 has no run(); route asyncio.run through its event loop policy instead
+    return asyncio.run(coro)
+
+def load_json(text: str) -> Any:
+    """Parse a JSON feed, using orjson when it is installed."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
 def is_probable_block_page(html: str) -> bool:
     if not html or len(html) < 200: return False
     h = html.lower()
@@ -338,7 +461,7 @@ def is_probable_block_page(html: str) -> bool:
 
 def parse_local_hhmm(time_text: str) -> Optional[str]:
     if not time_text: return None
-    match = re.search(r"\b(\d{1,2}):(\d{2})\s*([AaPp][Mm])?\b", time_text)
+    match = RE_HHMM.search(time_text)
     if not match: return None
     h, mm, ap = match.groups()
     hour = int(h)
@@ -346,8 +469,12 @@ def parse_local_hhmm(time_text: str) -> Optional[str]:
     if (ap or "").upper() == "AM" and hour == 12: hour = 0
     return f"{hour:02d}:{mm}"
 
+@lru_cache(maxsize=4096)
+def _host_of(url: str) -> str:
+    return urlsplit(url).netloc
+
 def _extract_meta_refresh_target(html: str) -> Optional[str]:
-    m = re.search(r'http-equiv=["\']?refresh["\']?[^>]*content=["\']?\s*\d+\s*;\s*url=([^"\'>\s]+)', html, re.I)
+    m = RE_META_REFRESH.search(html)
     return m.group(1).strip() if m else None
 
 # =============================================================================
@@ -358,27 +485,50 @@ class CacheManager:
     def __init__(self, cache_dir: Path):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(exist_ok=True, parents=True)
+        self._mem: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._mem_chars = 0
+        # Read once; configs that override CACHE without this key keep the default.
+        self._mem_limit = CONFIG["CACHE"].get("MEMORY_MAX_CHARS", 4_000_000)
+
+    def _forget(self, url: str):
+        if (old := self._mem.pop(url, None)) is not None: self._mem_chars -= len(old[1])
+
+    def _remember(self, url: str, stored_at: float, content: str):
+        # Pages bigger than the whole budget are never held; otherwise evict least-recent entries until it fits.
+        self._forget(url)
+        if len(content) > self._mem_limit: return
+        self._mem[url] = (stored_at, content); self._mem_chars += len(content)
+        while self._mem_chars > self._mem_limit: self._mem_chars -= len(self._mem.popitem(last=False)[1][1])
 
     def _path(self, url: str) -> Path:
-        return self.cache_dir / f"{hashlib.sha1(url.encode()).hexdigest()}.html"
+        return self.cache_dir / f"{hashlib.blake2b(url.encode(), digest_size=20).hexdigest()}.html"
 
     async def get(self, url: str) -> Optional[str]:
         if not CONFIG["CACHE"]["ENABLED"]: return None
+        hit = self._mem.get(url)
+        if hit and (time.time() - hit[0]) <= CONFIG["CACHE"]["DEFAULT_TTL"]:
+            self._mem.move_to_end(url)
+            return hit[1]
+        self._forget(url)
         path = self._path(url)
-        if not path.exists(): return None
         try:
-            if (datetime.now().timestamp() - path.stat().st_mtime) > CONFIG["CACHE"]["DEFAULT_TTL"]:
+            # A missing entry raises FileNotFoundError here, so no separate exists() probe.
+            stored_at = path.stat().st_mtime
+            if (time.time() - stored_at) > CONFIG["CACHE"]["DEFAULT_TTL"]:
                 path.unlink()
                 return None
-            async with aiofiles.open(path, "r", encoding="utf-8") as f:
-                return await f.read()
+            # Read off the event loop; asyncio.to_thread does the open, read and close in one worker-thread hop.
+            content = await asyncio.to_thread(path.read_text, encoding="utf-8")
+            self._remember(url, stored_at, content)
+            return content
         except Exception: return None
 
     async def set(self, url: str, content: str, ttl: Optional[int] = None):
         if not CONFIG["CACHE"]["ENABLED"]: return
         path = self._path(url)
-        async with aiofiles.open(path, "w", encoding="utf-8") as f:
-            await f.write(content)
+        await asyncio.to_thread(path.write_text, content, encoding="utf-8")
+        # Fresh fetches stay out of memory (most URLs are fetched once per run); only disk read-backs are remembered.
+        self._forget(url)
 
 class AsyncHttpClient:
     def __init__(self, cache: CacheManager, interactive_fallback: bool):
@@ -387,16 +537,28 @@ class AsyncHttpClient:
         self.semaphore = asyncio.Semaphore(CONFIG["HTTP"]["MAX_CONCURRENT_REQUESTS"])
         self.user_agent = random.choice(CONFIG["HTTP"]["USER_AGENTS"])
         self._client: Optional[httpx.AsyncClient] = None
+        self._curl: Optional[CurlCffiSession] = None
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
         self._host_last: Dict[str, float] = {}
-        self._throttle_lock = asyncio.Lock()
+        self._host_locks: Dict[str, asyncio.Lock] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=CONFIG["HTTP"]["REQUEST_TIMEOUT"], follow_redirects=True, http2=True)
+            transport = httpx.AsyncHTTPTransport(retries=CONFIG["HTTP"]["MAX_RETRIES"], http2=True)
+            # httpx advertises br in Accept-Encoding by itself once brotli is installed.
+            headers = {"Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8"}
+            self._client = httpx.AsyncClient(transport=transport, headers=headers, timeout=CONFIG["HTTP"]["REQUEST_TIMEOUT"], follow_redirects=True)
         return self._client
 
+    def _get_curl(self) -> CurlCffiSession:
+        # One impersonating session for the whole scan keeps connections and TLS sessions alive between requests.
+        if self._curl is None:
+            self._curl = CurlCffiSession(impersonate="chrome120", max_clients=CONFIG["HTTP"]["MAX_CONCURRENT_REQUESTS"])
+        return self._curl
+
     async def aclose(self):
         if self._client: await self._client.aclose()
+        if self._curl: await self._curl.close()
 
     def _prompt_for_manual_input(self, url: str) -> Optional[str]:
         print("\n" + "="*80, file=sys.stderr)
@@ -415,10 +577,19 @@ class AsyncHttpClient:
         if content: print("✅ HTML received, continuing scan...", file=sys.stderr); return content
         else: print("⏩ Skipped.", file=sys.stderr); return None
 
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = _host_of(url)
+        if (sem := self._host_sems.get(host)) is None:
+            sem = self._host_sems[host] = asyncio.Semaphore(CONFIG["HTTP"]["MAX_CONCURRENT_PER_HOST"])
+        return sem
+
     async def _throttle(self, url: str):
-        try: host = urlparse(url).netloc
+        try: host = _host_of(url)
         except Exception: return
-        async with self._throttle_lock:
+        # Pacing only needs to serialize requests to the same host.
+        if (lock := self._host_locks.get(host)) is None:
+            lock = self._host_locks[host] = asyncio.Lock()
+        async with lock:
             now = time.perf_counter()
             last = self._host_last.get(host, 0.0)
             wait = 0.25 - (now - last)
@@ -429,27 +600,27 @@ class AsyncHttpClient:
         cached = await self.cache.get(url)
         if cached and not is_probable_block_page(cached): return cached
         
-        async with self.semaphore:
+        # Take the per-host slot first so a slow host never parks global slots.
+        async with self._host_semaphore(url), self.semaphore:
             await self._throttle(url)
             content = None
             for attempt in range(CONFIG["HTTP"]["MAX_RETRIES"]):
                 try:
-                    async with CurlCffiSession(impersonate="chrome120") as session:
-                        headers = {"User-Agent": self.user_agent, "Referer": "https://www.google.com/"}
-                        response = await session.get(url, timeout=CONFIG["HTTP"]["REQUEST_TIMEOUT"], headers=headers)
-                        response.raise_for_status()
-                        content = response.text
-                        if not is_probable_block_page(content):
-                            if new_target := _extract_meta_refresh_target(content):
-                                client = await self._get_client()
-                                next_url = urljoin(url, new_target)
-                                response = await client.get(next_url, headers={"User-Agent": self.user_agent})
-                                content = response.text
-                            await self.cache.set(url, content)
-                            return content
-                        else:
-                            logging.debug(f"Block page detected for {url}, retrying...")
-                            await asyncio.sleep(CONFIG["HTTP"]["RETRY_BACKOFF_BASE"] ** attempt)
+                    headers = {"User-Agent": self.user_agent, "Referer": "https://www.google.com/"}
+                    response = await self._get_curl().get(url, timeout=CONFIG["HTTP"]["REQUEST_TIMEOUT"], headers=headers)
+                    response.raise_for_status()
+                    content = response.text
+                    if not is_probable_block_page(content):
+                        if new_target := _extract_meta_refresh_target(content):
+                            client = await self._get_client()
+                            next_url = urljoin(url, new_target)
+                            response = await client.get(next_url, headers={"User-Agent": self.user_agent})
+                            content = response.text
+                        await self.cache.set(url, content)
+                        return content
+                    else:
+                        logging.debug(f"Block page detected for {url}, retrying...")
+                        await asyncio.sleep(CONFIG["HTTP"]["RETRY_BACKOFF_BASE"] ** attempt)
                 except Exception as e:
                     logging.debug(f"Fetch failed for {url} (attempt {attempt+1}): {e}")
                     await asyncio.sleep(CONFIG["HTTP"]["RETRY_BACKOFF_BASE"] ** attempt)
@@ -546,6 +717,17 @@ class DataSourceBase:
         """Fetch races for the given date range - to be implemented by subclasses"""
         raise NotImplementedError
 
+    @staticmethod
+    def _soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse a page with the module-wide parser choice, optionally building only strained tags."""
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+    async def _fetch_links(self, url: str, selector: str, base: Optional[str] = None) -> List[str]:
+        """Fetch an index page and return its distinct absolute hrefs matching selector, sorted; the page is not retained."""
+        html = await self.http_client.fetch(url)
+        if not html: return []
+        return sorted({urljoin(base or url, a['href']) for a in self._soup(html, ANCHOR_STRAINER).select(selector)})
+
     def _add_error(self, message: str, url: Optional[str] = None, error_type: str = "ParsingError"):
         """Add error to the source error list"""
         error = SourceError(
@@ -577,7 +759,7 @@ class RacingAndSportsSource(DataSourceBase):
             return []
 
         try:
-            payload = json.loads(json_text)
+            payload = load_json(json_text)
             for discipline_group in payload or []:
                 discipline_name = (discipline_group.get("Discipline") or "").lower()
                 discipline = "greyhound" if "greyhound" in discipline_name else "harness" if "harness" in discipline_name else "thoroughbred"
@@ -595,11 +777,11 @@ class RacingAndSportsSource(DataSourceBase):
                             race_time = parse_local_hhmm(race_item.get("RaceTimeLocal"))
                             if not race_time: continue
 
-                            date_str = today.strftime("%Y-%m-%d")
+                            date_str = today.isoformat()
                             tz_name = get_track_timezone(course, country_code)
                             
                             try:
-                                local_dt = datetime.combine(today, datetime.strptime(race_time, "%H:%M").time()).replace(tzinfo=ZoneInfo(tz_name))
+                                local_dt = datetime.combine(today, hhmm_to_time(race_time), _zoneinfo(tz_name))
                             except Exception:
                                 self._add_error(f"Could not parse timezone '{tz_name}' for {course}")
                                 continue
@@ -610,8 +792,8 @@ class RacingAndSportsSource(DataSourceBase):
                                 id=generate_race_id(course, date_str, race_time),
                                 course=course,
                                 race_time=race_time,
-                                utc_datetime=local_dt.astimezone(ZoneInfo("UTC")),
-                                local_time=local_dt.strftime("%H:%M"),
+                                utc_datetime=local_dt.astimezone(UTC),
+                                local_time=format_hhmm(local_dt),
                                 timezone_name=tz_name,
                                 field_size=int(race_item.get("FieldSize") or 0),
                                 country=country_code,
@@ -640,7 +822,7 @@ class SportingLifeHorseApiSource(DataSourceBase):
                 self._add_error(f"Failed to fetch API data for {dt.strftime('%Y-%m-%d')}", url=api_url)
                 continue
             try:
-                payload = json.loads(json_text)
+                payload = load_json(json_text)
                 if not isinstance(payload, list):
                     self._add_error(f"API response was not a list for {dt.strftime('%Y-%m-%d')}", url=api_url)
                     continue
@@ -671,16 +853,16 @@ class SportingLifeHorseApiSource(DataSourceBase):
                     runners.append({"name": horse_name, "odds_str": (betting_info.get("current_odds") or "").strip()})
             if not runners: return None
 
-            fav_sorted = sorted(runners, key=lambda r: convert_odds_to_fractional(r.get("odds_str", "")))
+            fav_sorted = heapq.nsmallest(2, runners, key=_odds_key)
             country = (rs.get("country_code") or "GB").upper()
             tz_name = get_track_timezone(course, country)
-            local_dt = datetime.combine(datetime.fromisoformat(date_str).date(), datetime.strptime(time_str, "%H:%M").time()).replace(tzinfo=ZoneInfo(tz_name))
-            race_url = f"https://www.sportinglife.com/racing/racecards/{normalize_course_name(course).replace(' ', '-')}/{date_str}/{time_str.replace(':', '')}"
+            local_dt = datetime.combine(datetime.fromisoformat(date_str).date(), hhmm_to_time(time_str), _zoneinfo(tz_name))
+            race_url = f"https://www.sportinglife.com/racing/racecards/{course_slug(course)}/{date_str}/{time_str.replace(':', '')}"
 
             return RaceData(
                 id=generate_race_id(course, date_str, time_str),
-                course=course, race_time=time_str, utc_datetime=local_dt.astimezone(ZoneInfo("UTC")),
-                local_time=local_dt.strftime("%H:%M"), timezone_name=tz_name, field_size=ride_count,
+                course=course, race_time=time_str, utc_datetime=local_dt.astimezone(UTC),
+                local_time=format_hhmm(local_dt), timezone_name=tz_name, field_size=ride_count,
                 country=country, discipline="thoroughbred", favorite=fav_sorted[0] if fav_sorted else None,
                 second_favorite=fav_sorted[1] if len(fav_sorted) > 1 else None, all_runners=runners,
                 race_url=race_url, data_sources={"course": "SL-API", "runners": "SL-API", "odds": "SL-API"}
@@ -692,27 +874,22 @@ class SportingLifeHorseApiSource(DataSourceBase):
 class RacingPostSource(DataSourceBase):
     """Data source for the Racing Post, the gold standard for UK & Irish racing."""
     async def fetch_races(self, date_range: Tuple[datetime, datetime]) -> List[RaceData]:
-        races: List[RaceData] = []
+        results = await asyncio.gather(*(self._fetch_day(dt) for dt in self._days(date_range)))
+        return [race for sublist in results for race in sublist]
+
+    async def _fetch_day(self, dt: datetime) -> List[RaceData]:
         base_url = CONFIG['SOURCES']['RacingPost']['base_url']
-        for dt in self._days(date_range):
-            date_str = dt.strftime('%Y-%m-%d')
-            index_url = f"{base_url}/racecards/{date_str}"
-            html = await self.http_client.fetch(index_url)
-            if not html: continue
-
-            soup = BeautifulSoup(html, 'html.parser')
-            meeting_links = {urljoin(base_url, a['href']) for a in soup.select('a[data-test-selector="link-meetingCourseName"]')}
-            tasks = [self._parse_meeting(link, dt) for link in meeting_links]
-            results = await asyncio.gather(*tasks)
-            for res in results: races.extend(res)
-        return races
+        index_url = f"{base_url}/racecards/{dt.strftime('%Y-%m-%d')}"
+        meeting_links = await self._fetch_links(index_url, 'a[data-test-selector="link-meetingCourseName"]', base_url)
+        results = await asyncio.gather(*(self._parse_meeting(link, dt) for link in meeting_links))
+        return [race for sublist in results for race in sublist]
 
     async def _parse_meeting(self, meeting_url: str, dt: datetime) -> List[RaceData]:
         html = await self.http_client.fetch(meeting_url)
         if not html: return []
 
         races = []
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = self._soup(html)
         course = (soup.select_one('h1[data-test-selector="header-courseName"]') or soup.find('h1')).get_text(strip=True)
         country = "GB" # Assume GB/IE default
         
@@ -729,14 +906,14 @@ class RacingPostSource(DataSourceBase):
                 race_link = race_container.select_one('a[data-test-selector="racecard-raceTitleLink"]')
                 race_url = urljoin(meeting_url, race_link['href']) if race_link else meeting_url
 
-                date_str = dt.strftime("%Y-%m-%d")
+                date_str = dt.date().isoformat()
                 tz_name = get_track_timezone(course, country)
-                local_dt = datetime.combine(dt.date(), datetime.strptime(race_time, "%H:%M").time()).replace(tzinfo=ZoneInfo(tz_name))
+                local_dt = datetime.combine(dt.date(), hhmm_to_time(race_time), _zoneinfo(tz_name))
 
                 races.append(RaceData(
                     id=generate_race_id(course, date_str, race_time),
-                    course=course, race_time=race_time, utc_datetime=local_dt.astimezone(ZoneInfo("UTC")),
-                    local_time=local_dt.strftime("%H:%M"), timezone_name=tz_name, field_size=field_size,
+                    course=course, race_time=race_time, utc_datetime=local_dt.astimezone(UTC),
+                    local_time=format_hhmm(local_dt), timezone_name=tz_name, field_size=field_size,
                     country=country, discipline="thoroughbred", race_url=race_url, data_sources={"course": "RP", "runners": "RP"}
                 ))
             except Exception as e:
@@ -745,81 +922,98 @@ class RacingPostSource(DataSourceBase):
 
 class SkySportsSource(DataSourceBase):
     async def fetch_races(self, date_range: Tuple[datetime, datetime]) -> List[RaceData]:
-        races: List[RaceData] = []
+        results = await asyncio.gather(*(self._fetch_day(dt) for dt in self._days(date_range)))
+        return [race for sublist in results for race in sublist]
+
+    async def _fetch_day(self, dt: datetime) -> List[RaceData]:
         base_url = CONFIG["SOURCES"]["SkySports"]["base_url"]
-        for dt in self._days(date_range):
-            url = f"{base_url}/{dt.strftime('%d-%m-%Y')}" if dt.date() != datetime.now().date() else base_url
-            html = await self.http_client.fetch(url)
-            if not html: continue
-            soup = BeautifulSoup(html, 'html.parser')
-            for container in soup.find_all('div', class_='sdc-site-racing-meetings__event'):
-                try:
-                    link = container.find('a', class_='sdc-site-racing-meetings__event-link')
-                    if not link or not link.get('href'): continue
-                    race_url = urljoin(url, link['href'])
-                    details = container.find('span', class_='sdc-site-racing-meetings__event-details')
-                    if not details: continue
-                    details_text = details.get_text(strip=True)
-                    runners_match = re.search(r'(\d+)\s+runners?', details_text, re.I)
-                    field_size = int(runners_match.group(1)) if runners_match else 0
-                    if field_size == 0: continue
-                    time_str = parse_local_hhmm(details_text)
-                    if not time_str: continue
-                    path_parts = urlparse(race_url).path.strip('/').split('/')
-                    racecards_idx = path_parts.index('racecards')
-                    course_slug = path_parts[racecards_idx + 1]
-                    course_name = course_slug.replace('-', ' ').title()
-                    country_match = re.search(r'\(([^)]+)\)', details_text)
-                    country = country_match.group(1) if country_match else "GB"
-                    tz_name = get_track_timezone(course_name, country)
-                    local_dt = datetime.combine(dt.date(), datetime.strptime(time_str, "%H:%M").time()).replace(tzinfo=ZoneInfo(tz_name))
-                    races.append(RaceData(
-                        id=generate_race_id(course_name, dt.strftime("%Y-%m-%d"), time_str),
-                        course=course_name, race_time=time_str, utc_datetime=local_dt.astimezone(ZoneInfo("UTC")),
-                        local_time=local_dt.strftime("%H:%M"), timezone_name=tz_name, field_size=field_size,
-                        country=country, discipline="thoroughbred", race_url=race_url, data_sources={"course": "SkySports"}
-                    ))
-                except Exception as e:
-                    self._add_error(f"Error parsing SkySports race container: {e}")
-                    continue
+        url = f"{base_url}/{dt.strftime('%d-%m-%Y')}" if dt.date() != datetime.now().date() else base_url
+        html = await self.http_client.fetch(url)
+        if not html: return []
+        # Parsing is CPU-bound; run it off the event loop so other fetches keep moving.
+        return await asyncio.to_thread(self._parse_day_html, html, url, dt)
+
+    def _parse_day_html(self, html: str, url: str, dt: datetime) -> List[RaceData]:
+        races: List[RaceData] = []
+        soup = self._soup(html)
+        for container in soup.find_all('div', class_='sdc-site-racing-meetings__event'):
+            try:
+                link = container.find('a', class_='sdc-site-racing-meetings__event-link')
+                if not link or not link.get('href'): continue
+                race_url = urljoin(url, link['href'])
+                details = container.find('span', class_='sdc-site-racing-meetings__event-details')
+                if not details: continue
+                details_text = details.get_text(strip=True)
+                runners_match = RE_RUNNERS.search(details_text)
+                field_size = int(runners_match.group(1)) if runners_match else 0
+                if field_size == 0: continue
+                time_str = parse_local_hhmm(details_text)
+                if not time_str: continue
+                path_parts = urlparse(race_url).path.strip('/').split('/')
+                racecards_idx = path_parts.index('racecards')
+                slug = path_parts[racecards_idx + 1]
+                course_name = course_from_slug(slug)
+                country_match = RE_COUNTRY.search(details_text)
+                country = country_match.group(1) if country_match else "GB"
+                tz_name = get_track_timezone(course_name, country)
+                local_dt = datetime.combine(dt.date(), hhmm_to_time(time_str), _zoneinfo(tz_name))
+                races.append(RaceData(
+                    id=generate_race_id(course_name, dt.date().isoformat(), time_str),
+                    course=course_name, race_time=time_str, utc_datetime=local_dt.astimezone(UTC),
+                    local_time=format_hhmm(local_dt), timezone_name=tz_name, field_size=field_size,
+                    country=country, discipline="thoroughbred", race_url=race_url, data_sources={"course": "SkySports"}
+                ))
+            except Exception as e:
+                self._add_error(f"Error parsing SkySports race container: {e}")
+                continue
         return races
 
 class AtTheRacesSource(DataSourceBase):
     async def fetch_races(self, date_range: Tuple[datetime, datetime]) -> List[RaceData]:
+        # One flat batch over every (day, region) pair; the HTTP client caps concurrency.
+        jobs = [(f"{CONFIG['SOURCES']['AtTheRaces']['base_url']}/ajax/marketmovers/tabs/{region}/{dt.strftime('%Y%m%d')}", region, dt)
+                for dt in self._days(date_range) for region in CONFIG["SOURCES"]["AtTheRaces"]["regions"]]
+        results = await asyncio.gather(*(self._parse_atr_region(url, region, dt.date()) for url, region, dt in jobs), return_exceptions=True)
         races = []
-        for dt in self._days(date_range):
-            for region in CONFIG["SOURCES"]["AtTheRaces"]["regions"]:
-                url = f"{CONFIG['SOURCES']['AtTheRaces']['base_url']}/ajax/marketmovers/tabs/{region}/{dt.strftime('%Y%m%d')}"
-                try: races.extend(await self._parse_atr_region(url, region, dt.date()))
-                except Exception as e: self._add_error(f"Failed to parse ATR region {region}: {e}", url=url)
+        for (url, region, _), res in zip(jobs, results):
+            if isinstance(res, Exception): self._add_error(f"Failed to parse ATR region {region}: {res}", url=url)
+            else: races.extend(res)
         return races
 
     async def _parse_atr_region(self, url: str, region: str, date: datetime.date) -> List[RaceData]:
         html = await self.http_client.fetch(url)
         if not html: return []
-        races, soup = [], BeautifulSoup(html, 'html.parser')
-        for caption in soup.find_all('caption', string=re.compile(r'^\d{2}:\d{2}')):
+        return await asyncio.to_thread(self._parse_atr_html, html, region, date)
+
+    def _parse_atr_html(self, html: str, region: str, date: datetime.date) -> List[RaceData]:
+        races, soup, last_heading, panel_headings = [], self._soup(html), None, {}
+        # The walk carries each node's enclosing panel, so no caption climbs the tree. A caption inside a panel takes
+        # that panel's heading (looked up once per panel), otherwise the nearest heading above it.
+        for node, panel in _iter_panel_nodes(soup):
+            if node.name == 'h2': last_heading = node; continue
+            if node.string is None or not RE_CAPTION_TIME.search(node.string): continue
             try:
-                race_time = caption.get_text(strip=True).split()[0]
-                panel = caption.find_parent('div', class_=re.compile(r'\bpanel\b'))
-                course_heading = panel.find('h2') if panel else caption.find_previous('h2')
+                race_time = node.get_text(strip=True).split()[0]
+                if panel is None: course_heading = last_heading
+                elif id(panel) in panel_headings: course_heading = panel_headings[id(panel)]
+                else: course_heading = panel_headings[id(panel)] = panel.find('h2')
                 if not course_heading: continue
                 course_name = course_heading.get_text(strip=True)
-                table = caption.find_next_sibling('table')
+                table = node.find_next_sibling('table')
                 if not table: continue
                 runners = [{'name': c[0].get_text(strip=True), 'odds_str': c[1].get_text(strip=True)} for r in (table.find('tbody') or table).find_all('tr') if (c := r.find_all(['td', 'th'])) and len(c) > 1 and c[0].get_text(strip=True)]
                 if not runners: continue
-                sorted_runners = sorted(runners, key=lambda x: convert_odds_to_fractional(x.get('odds_str', '')))
+                sorted_runners = heapq.nsmallest(2, runners, key=_odds_key)
                 country_map = {'uk': 'GB', 'ireland': 'IE', 'usa': 'US', 'france': 'FR', 'saf': 'ZA', 'aus': 'AU'}
                 country = country_map.get(region, 'GB')
                 tz_name = get_track_timezone(course_name, country)
-                local_dt = datetime.combine(date, datetime.strptime(race_time, "%H:%M").time()).replace(tzinfo=ZoneInfo(tz_name))
+                local_dt = datetime.combine(date, hhmm_to_time(race_time), _zoneinfo(tz_name))
                 races.append(RaceData(
-                    id=generate_race_id(course_name, date.strftime("%Y-%m-%d"), race_time),
-                    course=course_name, race_time=race_time, utc_datetime=local_dt.astimezone(ZoneInfo("UTC")),
-                    local_time=local_dt.strftime("%H:%M"), timezone_name=tz_name, field_size=len(runners),
+                    id=generate_race_id(course_name, date.isoformat(), race_time),
+                    course=course_name, race_time=race_time, utc_datetime=local_dt.astimezone(UTC),
+                    local_time=format_hhmm(local_dt), timezone_name=tz_name, field_size=len(runners),
                     country=country, discipline="thoroughbred",
-                    race_url=f"{CONFIG['SOURCES']['AtTheRaces']['base_url']}/racecard/{normalize_course_name(course_name).replace(' ', '-')}/{date.strftime('%Y-%m-%d')}/{race_time.replace(':', '')}",
+                    race_url=f"{CONFIG['SOURCES']['AtTheRaces']['base_url']}/racecard/{course_slug(course_name)}/{date.isoformat()}/{race_time.replace(':', '')}",
                     all_runners=runners, favorite=sorted_runners[0] if sorted_runners else None,
                     second_favorite=sorted_runners[1] if len(sorted_runners) > 1 else None,
                     data_sources={"course": "ATR", "runners": "ATR", "odds": "ATR"}
@@ -833,10 +1027,7 @@ class GBGreyhoundSource(DataSourceBase):
     async def fetch_races(self, date_range: Tuple[datetime, datetime]) -> List[RaceData]:
         base_url = CONFIG["SOURCES"]["GBGreyhounds"]["base_url"]
         index_url = f"{base_url}/greyhounds/racecards"
-        html = await self.http_client.fetch(index_url)
-        if not html: return []
-        soup = BeautifulSoup(html, 'html.parser')
-        meeting_links = {urljoin(base_url, a['href']) for a in soup.select('a[href*="/greyhounds/racecards/"]')}
+        meeting_links = await self._fetch_links(index_url, 'a[href*="/greyhounds/racecards/"]', base_url)
         tasks = [self._parse_meeting(link) for link in meeting_links]
         results = await asyncio.gather(*tasks)
         return [race for sublist in results for race in sublist]
@@ -845,21 +1036,22 @@ class GBGreyhoundSource(DataSourceBase):
         html = await self.http_client.fetch(meeting_url)
         if not html: return []
         races = []
-        soup = BeautifulSoup(html, 'html.parser')
-        for link in soup.select('a[href*="/racecard/"]'):
-            race_url = urljoin(meeting_url, link['href'])
+        soup = self._soup(html, ANCHOR_STRAINER)
+        # Meeting pages link each card more than once; dedupe hrefs in page order.
+        for href in dict.fromkeys(a['href'] for a in soup.select('a[href*="/racecard/"]')):
+            race_url = urljoin(meeting_url, href)
             try:
                 path_parts = urlparse(race_url).path.strip('/').split('/')
-                course = path_parts[-3].replace('-', ' ').title()
+                course = course_from_slug(path_parts[-3])
                 date_str = path_parts[-2]
                 time_str_raw = path_parts[-1]
                 time_str = f"{time_str_raw[:2]}:{time_str_raw[2:]}"
                 tz_name = get_track_timezone(course, "GB")
-                local_dt = datetime.combine(datetime.fromisoformat(date_str).date(), datetime.strptime(time_str, "%H:%M").time()).replace(tzinfo=ZoneInfo(tz_name))
+                local_dt = datetime.combine(datetime.fromisoformat(date_str).date(), hhmm_to_time(time_str), _zoneinfo(tz_name))
                 races.append(RaceData(
                     id=generate_race_id(course, date_str, time_str),
-                    course=course, race_time=time_str, utc_datetime=local_dt.astimezone(ZoneInfo("UTC")),
-                    local_time=local_dt.strftime("%H:%M"), timezone_name=tz_name, field_size=6, # Assume 6
+                    course=course, race_time=time_str, utc_datetime=local_dt.astimezone(UTC),
+                    local_time=format_hhmm(local_dt), timezone_name=tz_name, field_size=6, # Assume 6
                     country="GB", discipline="greyhound", race_url=race_url, data_sources={"course": "SL-GR"}
                 ))
             except Exception as e:
@@ -868,34 +1060,31 @@ class GBGreyhoundSource(DataSourceBase):
 
 class HarnessAustraliaSource(DataSourceBase):
     async def fetch_races(self, date_range: Tuple[datetime, datetime]) -> List[RaceData]:
-        out = []
-        for dt in self._days(date_range):
-            url = f"{CONFIG['SOURCES']['HarnessAustralia']['base_url']}/racing/fields/?firstDate={dt.strftime('%d/%m/%Y')}"
-            html = await self.http_client.fetch(url)
-            if not html: continue
-            soup = BeautifulSoup(html, 'html.parser')
-            meeting_links = {urljoin(url, a['href']) for a in soup.select('a[href*="/racing/fields/race-fields/"]')}
-            tasks = [self._parse_meeting(link, dt) for link in meeting_links]
-            results = await asyncio.gather(*tasks)
-            for res in results: out.extend(res)
-        return out
+        results = await asyncio.gather(*(self._fetch_day(dt) for dt in self._days(date_range)))
+        return [race for sublist in results for race in sublist]
+
+    async def _fetch_day(self, dt: datetime) -> List[RaceData]:
+        url = f"{CONFIG['SOURCES']['HarnessAustralia']['base_url']}/racing/fields/?firstDate={dt.strftime('%d/%m/%Y')}"
+        meeting_links = await self._fetch_links(url, 'a[href*="/racing/fields/race-fields/"]')
+        results = await asyncio.gather(*(self._parse_meeting(link, dt) for link in meeting_links))
+        return [race for sublist in results for race in sublist]
 
     async def _parse_meeting(self, meeting_url: str, dt: datetime) -> List[RaceData]:
         html = await self.http_client.fetch(meeting_url)
         if not html: return []
         races = []
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self._soup(html, HRA_MEETING_STRAINER)
             course = (soup.find('h1') or soup.find('h2')).get_text(strip=True)
             for race_link in soup.select('a[href*="race-fields/?mc="]'):
                 race_time = parse_local_hhmm(race_link.get_text(strip=True))
                 if not race_time: continue
                 tz_name = get_track_timezone(course, "AU")
-                local_dt = datetime.combine(dt.date(), datetime.strptime(race_time, "%H:%M").time()).replace(tzinfo=ZoneInfo(tz_name))
+                local_dt = datetime.combine(dt.date(), hhmm_to_time(race_time), _zoneinfo(tz_name))
                 races.append(RaceData(
-                    id=generate_race_id(course, dt.strftime("%Y-%m-%d"), race_time),
-                    course=course, race_time=race_time, utc_datetime=local_dt.astimezone(ZoneInfo("UTC")),
-                    local_time=local_dt.strftime("%H:%M"), timezone_name=tz_name, field_size=0,
+                    id=generate_race_id(course, dt.date().isoformat(), race_time),
+                    course=course, race_time=race_time, utc_datetime=local_dt.astimezone(UTC),
+                    local_time=format_hhmm(local_dt), timezone_name=tz_name, field_size=0,
                     country="AU", discipline="harness", race_url=urljoin(meeting_url, race_link['href']),
                     data_sources={"course": "HRA"}
                 ))
@@ -905,37 +1094,37 @@ class HarnessAustraliaSource(DataSourceBase):
 
 class StandardbredCanadaSource(DataSourceBase):
     async def fetch_races(self, date_range: Tuple[datetime, datetime]) -> List[RaceData]:
-        out = []
-        for dt in self._days(date_range):
-            url = f"{CONFIG['SOURCES']['StandardbredCanada']['base_url']}/racing/entries/date/{dt.strftime('%Y-%m-%d')}"
-            html = await self.http_client.fetch(url)
-            if not html: continue
-            soup = BeautifulSoup(html, 'html.parser')
-            meeting_links = {urljoin(url, a['href']) for a in soup.select(f'a[href*="/racing/entries/"][href*="{dt.strftime("%Y-%m-%d")}"]')}
-            tasks = [self._parse_meeting(link, dt) for link in meeting_links]
-            results = await asyncio.gather(*tasks)
-            for res in results: out.extend(res)
-        return out
+        results = await asyncio.gather(*(self._fetch_day(dt) for dt in self._days(date_range)))
+        return [race for sublist in results for race in sublist]
+
+    async def _fetch_day(self, dt: datetime) -> List[RaceData]:
+        day = dt.strftime("%Y-%m-%d")
+        url = f"{CONFIG['SOURCES']['StandardbredCanada']['base_url']}/racing/entries/date/{day}"
+        # Constant selector (compiled once by soupsieve); the day is then matched anywhere in the href, as the old per-day selector did.
+        meeting_links = await self._fetch_links(url, 'a[href*="/racing/entries/"]')
+        tasks = [self._parse_meeting(link, dt) for link in meeting_links if day in link]
+        results = await asyncio.gather(*tasks)
+        return [race for sublist in results for race in sublist]
 
     async def _parse_meeting(self, meeting_url: str, dt: datetime) -> List[RaceData]:
         html = await self.http_client.fetch(meeting_url)
         if not html: return []
         races = []
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self._soup(html, STDCAN_MEETING_STRAINER)
             course = (soup.find('h1') or soup.find('h2')).get_text(strip=True)
             for section in soup.select("section[id^='race-']"):
                 time_text = (section.find(class_='post-time') or section).get_text()
                 race_time = parse_local_hhmm(time_text)
                 if not race_time: continue
-                runners = section.select("table.entries tbody tr")
+                runners = section.select("table.entries tbody tr", limit=MAX_FIELD_ROWS)
                 tz_name = get_track_timezone(course, "CA")
-                local_dt = datetime.combine(dt.date(), datetime.strptime(race_time, "%H:%M").time()).replace(tzinfo=ZoneInfo(tz_name))
+                local_dt = datetime.combine(dt.date(), hhmm_to_time(race_time), _zoneinfo(tz_name))
                 races.append(RaceData(
-                    id=generate_race_id(course, dt.strftime("%Y-%m-%d"), race_time),
-                    course=course, race_time=race_time, utc_datetime=local_dt.astimezone(ZoneInfo("UTC")),
-                    local_time=local_dt.strftime("%H:%M"), timezone_name=tz_name, field_size=len(runners),
-                    country="CA", discipline="harness", race_url=meeting_url, all_runners=[{"name": "Runner", "odds_str":""}]*len(runners),
+                    id=generate_race_id(course, dt.date().isoformat(), race_time),
+                    course=course, race_time=race_time, utc_datetime=local_dt.astimezone(UTC),
+                    local_time=format_hhmm(local_dt), timezone_name=tz_name, field_size=len(runners),
+                    country="CA", discipline="harness", race_url=meeting_url,
                     data_sources={"course": "StdCan", "runners": "StdCan"}
                 ))
         except Exception as e:
@@ -967,19 +1156,14 @@ class RacingDataAggregator:
 
     async def fetch_all_races(self, start_dt: datetime, end_dt: datetime) -> Tuple[List[RaceData], ScanStatistics]:
         stats = ScanStatistics()
-        tasks = [self._fetch_from_source(source, start_dt, end_dt) for source in self.sources]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
+        # _fetch_from_source turns failures into SourceErrors, so every result has the same shape.
+        results = await asyncio.gather(*(self._fetch_from_source(source, start_dt, end_dt) for source in self.sources))
+
         all_races = []
-        for i, result in enumerate(results):
-            source = self.sources[i]
-            if isinstance(result, Exception):
-                stats.source_errors.append(SourceError(source_name=source.name, error_message=str(result), error_type=type(result).__name__, timestamp=datetime.now()))
-            else:
-                races, source_errors = result
-                stats.per_source_counts[source.name] = len(races)
-                stats.source_errors.extend(source_errors)
-                all_races.extend(races)
+        for source, (races, source_errors) in zip(self.sources, results):
+            stats.per_source_counts[source.name] = len(races)
+            stats.source_errors.extend(source_errors)
+            all_races.extend(races)
         
         stats.total_races_found = len(all_races)
         deduped_races = self._deduplicate_races(all_races)
@@ -988,8 +1172,9 @@ class RacingDataAggregator:
         
         for race in deduped_races:
             race.value_score = self.scorer.calculate_score(race)
-            
-        return sorted(deduped_races, key=lambda r: r.value_score, reverse=True), stats
+
+        deduped_races.sort(key=attrgetter("value_score"), reverse=True)
+        return deduped_races, stats
 
     async def _fetch_from_source(self, source: DataSourceBase, start_dt: datetime, end_dt: datetime) -> Tuple[List[RaceData], List[SourceError]]:
         try:
@@ -1000,55 +1185,88 @@ class RacingDataAggregator:
             return [], [SourceError(source_name=source.name, error_message=str(e), error_type=type(e).__name__, timestamp=datetime.now())]
 
     def _deduplicate_races(self, races: List[RaceData]) -> List[RaceData]:
-        unique_races = {}
+        buckets: Dict[str, List[RaceData]] = {}
         for race in races:
-            key = generate_race_id(race.course, race.utc_datetime.strftime('%Y-%m-%d'), race.race_time)
-            if key not in unique_races or self._is_more_complete(race, unique_races[key]):
-                if key in unique_races:
-                    race.data_sources.update(unique_races[key].data_sources)
-                unique_races[key] = race
-            else:
-                unique_races[key].data_sources.update(race.data_sources)
-        return list(unique_races.values())
-
-    def _is_more_complete(self, race1: RaceData, race2: RaceData) -> bool:
-        return self.scorer._calculate_data_quality_score(race1) > self.scorer._calculate_data_quality_score(race2)
+            buckets.setdefault(generate_race_id(race.course, race.utc_datetime.date().isoformat(), race.race_time), []).append(race)
+        unique_races = []
+        quality = self.scorer._calculate_data_quality_score
+        for bucket in buckets.values():
+            best = bucket[0]
+            if len(bucket) > 1:
+                # Replay the pairwise merge in arrival order so winners and attributions match the per-race loop;
+                # only the running winner is rescored, since its score counts the sources merged into it.
+                best_score = quality(best)
+                for race in bucket[1:]:
+                    if quality(race) > best_score: race.data_sources.update(best.data_sources); best = race
+                    else: best.data_sources.update(race.data_sources)
+                    best_score = quality(best)
+            unique_races.append(best)
+        return unique_races
 
     async def _enrich_rs_links(self, races: List[RaceData]) -> None:
         url = "https://www.racingandsports.com.au/todays-racing-json-v2"
         try:
             if not (text := await self.http_client.fetch(url)): return
-            payload = json.loads(text); lookup: Dict[Tuple[str, str], str] = {}
+            payload = load_json(text); lookup: Dict[Tuple[str, str], str] = {}
             for disc in payload or []:
                 for country in disc.get("Countries", []):
                     for meet in country.get("Meetings", []):
                         course = meet.get("Course")
                         link = meet.get("PDFUrl") or meet.get("PreMeetingUrl")
                         if not course or not link: continue
-                        if not (m := re.search(r"/(\d{4}-\d{2}-\d{2})", link)): continue
+                        if not (m := RE_URL_DATE.search(link)): continue
                         lookup[(normalize_course_name(course), m.group(1))] = link
             for r in races:
-                date = r.utc_datetime.astimezone(ZoneInfo(r.timezone_name)).strftime("%Y-%m-%d")
-                key = (normalize_course_name(r.course), date)
-                if (link := lookup.get(key)) and not r.form_guide_url:
+                if r.form_guide_url: continue
+                date = r.utc_datetime.astimezone(_zoneinfo(r.timezone_name)).date().isoformat()
+                if link := lookup.get((normalize_course_name(r.course), date)):
                     r.form_guide_url = link
                     r.data_sources["form"] = "R&S"
         except Exception as e:
             logging.debug(f"R&S enrichment failed: {e}")
 
+JINJA_ENV = Environment()
+
+@lru_cache(maxsize=8)
+def compile_template(source: str):
+    """Compile a report template once; from_string() bypasses Jinja's own template cache."""
+    return JINJA_ENV.from_string(source)
+
+RACE_FIELDS = tuple(f.name for f in fields(RaceData))
+# Every field value in declaration order, fetched in one C-level call per race.
+RACE_VALUES = attrgetter(*RACE_FIELDS)
+# The CSV's leading plain-attribute columns, fetched in one C-level call per row.
+CSV_LEADING_FIELDS = attrgetter("id", "course", "local_time", "field_size", "country", "discipline")
+
+def race_card_renderer(source: str = RACE_CARD_TEMPLATE):
+    """Per-report memo of rendered race cards; a race listed on several tabs is rendered once."""
+    card_template, cards = compile_template(source), {}
+    def render_race(race: RaceData) -> str:
+        if (card := cards.get(id(race))) is None: card = cards[id(race)] = card_template.render(race=race)
+        return card
+    return render_race
+
+def split_report_races(races: List[RaceData], min_r: int, max_r: int) -> Tuple[List[RaceData], List[RaceData]]:
+    """The report's field-size tab and 70+ value tab, collected in a single pass over the races."""
+    filtered_races, value_races = [], []
+    for r in races:
+        if min_r <= r.field_size <= max_r: filtered_races.append(r)
+        if r.value_score >= 70: value_races.append(r)
+    return filtered_races, value_races
+
 class OutputManager:
     def __init__(self, out_dir: Path):
         self.out_dir = out_dir
         self.out_dir.mkdir(exist_ok=True, parents=True)
-        self.jinja_env = Environment()
+        self.jinja_env = JINJA_ENV
 
     def write_html_report(self, races: List[RaceData], stats: ScanStatistics, min_r: int, max_r: int):
         filename = self.out_dir / f"racing_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        template = self.jinja_env.from_string(HTML_TEMPLATE)
+        template = compile_template(HTML_TEMPLATE)
+        filtered_races, value_races = split_report_races(races, min_r, max_r)
         html = template.render(
-            config=CONFIG, stats=stats, all_races=races,
-            filtered_races=[r for r in races if min_r <= r.field_size <= max_r],
-            value_races=[r for r in races if r.value_score >= 70],
+            config=CONFIG, stats=stats, all_races=races, render_race=race_card_renderer(),
+            filtered_races=filtered_races, value_races=value_races,
             generated_at=datetime.now().isoformat(timespec="seconds"),
             min_runners=min_r, max_runners=max_r
         )
@@ -1056,17 +1274,27 @@ class OutputManager:
             f.write(html)
         logging.info(f"Report saved to {filename}")
         if CONFIG["OUTPUT"]["AUTO_OPEN_BROWSER"]:
+            import webbrowser  # Only needed when a browser is opened, so unattended scans skip its import
             webbrowser.open(f"file://{os.path.abspath(filename)}")
 
-    def write_json_report(self, races: List[RaceData], stats: ScanStatistics) -> Path:
+    @staticmethod
+    def _race_to_dict(race: RaceData) -> Dict[str, Any]:
+        """Shallow, None-free field dict; the serializer copies nothing, so asdict's deep copy is skipped."""
+        return {name: value for name, value in zip(RACE_FIELDS, RACE_VALUES(race)) if value is not None}
+
+    def write_json_report(self, races: List[RaceData], stats: ScanStatistics, pretty: bool = False) -> Path:
         filename = self.out_dir / f"racing_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        races_data = [asdict(r, dict_factory=lambda data: {k: v for k, v in data if v is not None}) for r in races]
-        for r in races_data: r['utc_datetime'] = r['utc_datetime'].isoformat()
-        stats_data = asdict(stats)
-        for error in stats_data['source_errors']: error['timestamp'] = error['timestamp'].isoformat()
-        output_data = {'generated_at': datetime.now().isoformat(), 'statistics': stats_data, 'races': races_data}
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2)
+        with open(filename, 'wb') as f:
+            if pretty:
+                # Indentation is opt-in: build the document once and write it indented in a single call.
+                f.write(dump_json_bytes({"generated_at": datetime.now().isoformat(), "statistics": asdict(stats), "races": [self._race_to_dict(r) for r in races]}, pretty=True))
+            else:
+                # Stream the races array one object at a time so the full document is never held in memory.
+                f.write(b'{"generated_at":' + dump_json_bytes(datetime.now().isoformat()) + b',"statistics":' + dump_json_bytes(asdict(stats)) + b',"races":[')
+                for i, r in enumerate(races):
+                    if i: f.write(b",")
+                    f.write(dump_json_bytes(self._race_to_dict(r)))
+                f.write(b"]}")
         logging.info(f"JSON data saved to {filename}")
         return filename
 
@@ -1075,9 +1303,9 @@ class OutputManager:
         with open(filename, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(["ID", "Course", "Time", "Field Size", "Country", "Discipline", "Score", "Fav Name", "Fav Odds", "URL"])
-            for r in races:
-                fav = r.favorite or {}
-                writer.writerow([r.id, r.course, r.local_time, r.field_size, r.country, r.discipline, f"{r.value_score:.1f}", fav.get('name',''), fav.get('odds_str',''), r.race_url])
+            writer.writerows(
+                (*CSV_LEADING_FIELDS(r), format(r.value_score, ".1f"), fav.get('name', ''), fav.get('odds_str', ''), r.race_url)
+                for r in races for fav in (r.favorite or NO_FAVORITE,))
         logging.info(f"CSV data saved to {filename}")
         return filename
 
@@ -1104,7 +1332,7 @@ async def main_async(args: argparse.Namespace):
         if 'html' in args.formats:
             output_manager.write_html_report(races, stats, args.min_field_size, args.max_field_size)
         if 'json' in args.formats:
-            output_manager.write_json_report(races, stats)
+            output_manager.write_json_report(races, stats, pretty=args.pretty)
         if 'csv' in args.formats:
             output_manager.write_csv_report(races)
         
@@ -1116,7 +1344,7 @@ async def main_async(args: argparse.Namespace):
                 print(f"   {race.course} {race.local_time} - {race.field_size} runners - Score: {race.value_score:.0f} - Fav: {fav_name}")
     except KeyboardInterrupt: print("\n⏹️ Scan interrupted by user")
     except Exception as e: logging.error(f"Critical error: {e}", exc_info=True); print(f"❌ Critical error occurred: {e}")
-    finally: await http_client.close()
+    finally: await http_client.aclose()
 
 def main():
     parser = argparse.ArgumentParser(description=f"{CONFIG['APP_NAME']} v{CONFIG['SCHEMA_VERSION']}", formatter_class=argparse.RawDescriptionHelpFormatter, epilog="""
@@ -1125,6 +1353,7 @@ Examples:
   python racing_scanner.py --min-field-size 3 --max-field-size 6
   python racing_scanner.py --interactive           # Enable manual HTML input
   python racing_scanner.py --formats html json csv # Specify output formats
+  python racing_scanner.py --formats json --pretty # Indented JSON for reading by hand
     """)
     parser.add_argument("--days-back", type=int, default=0, help="Days back to scan (e.g., -1 for yesterday)")
     parser.add_argument("--days-forward", type=int, default=1, help="Days forward to scan")
@@ -1132,10 +1361,11 @@ Examples:
     parser.add_argument("--max-field-size", type=int, default=CONFIG["FILTERS"]["MAX_FIELD_SIZE"])
     parser.add_argument("--interactive", action="store_true", help="Enable interactive fallback for manual HTML input")
     parser.add_argument("--formats", nargs='+', default=['html'], help="Output formats (html, json, csv)")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON report (compact by default)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose debug logging")
     args = parser.parse_args()
     try:
-        asyncio.run(main_async(args))
+        run_async(main_async(args))
         print("🎯 Scan complete! Good luck with your bets! 🍀")
     except KeyboardInterrupt: print("\n👋 Goodbye!")
     except Exception as e: print(f"💥 Unexpected error: {e}"); sys.exit(1)
@@ -7,8 +7,12 @@ and performance on mobile devices.
 """
 
 # Import the original scanner
+import argparse
+import logging
 import sys
 import os
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
 
 # Add the current directory to Python path to import the original scanner
@@ -17,7 +21,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Import the original scanner's main components
 from racing_scanner import (
     CONFIG, HTML_TEMPLATE, CacheManager, AsyncHttpClient, 
-    RacingDataAggregator, OutputManager, main_async
+    RacingDataAggregator, OutputManager, compile_template, race_card_renderer, split_report_races, run_async, main_async
 )
 
 # Mobile-specific configuration overrides
@@ -26,6 +30,7 @@ MOBILE_CONFIG = {
     "HTTP": {
         "REQUEST_TIMEOUT": 45.0,  # Increased timeout for mobile networks
         "MAX_CONCURRENT_REQUESTS": 6,  # Reduced from 12 to 6 for mobile
+        "MAX_CONCURRENT_PER_HOST": 2,  # Keep a single site from taking every slot
         "MAX_RETRIES": 2,  # Reduced retries to save battery
         "RETRY_BACKOFF_BASE": 1.5,  # Gentler backoff
         "USER_AGENTS": [
@@ -38,7 +43,8 @@ MOBILE_CONFIG = {
     "CACHE": {
         "DEFAULT_TTL": 3600,      # 1 hour for mobile (longer to reduce network usage)
         "MANUAL_FETCH_TTL": 43200, # 12 hours for manual fetches
-        "ENABLED": True
+        "ENABLED": True,
+        "MEMORY_MAX_CHARS": 1_000_000  # Smaller in-process LRU to spare phone memory
     },
     
     # Mobile-friendly output settings
@@ -57,6 +63,59 @@ MOBILE_CONFIG = {
 # Override the original CONFIG with mobile settings
 CONFIG.update(MOBILE_CONFIG)
 
+# Mobile race card, rendered once per race and shared by the three tabs
+MOBILE_RACE_CARD_TEMPLATE = """
+                <div class="race {{ race.discipline }} value-{% if race.value_score >= 90 %}extreme{% elif race.value_score >= 80 %}high{% elif race.value_score >= 70 %}good{% else %}decent{% endif %}" data-score="{{ race.value_score }}">
+                    <div class="race-header">
+                        <div class="course-name">{{ race.course }}</div>
+                        <div class="discipline-icon">
+                            {% if race.discipline == 'thoroughbred' %}🐎{% elif race.discipline == 'harness' %}🏇{% elif race.discipline == 'greyhound' %}🐕{% endif %}
+                        </div>
+                    </div>
+                    
+                    <div class="race-meta">
+                        <span class="meta-pill">{{ race.country }}</span>
+                        <span class="meta-pill">{{ race.local_time }} {{ race.timezone_name }}</span>
+                        <span class="meta-pill value-score value-score-{% if race.value_score >= 90 %}90plus{% elif race.value_score >= 80 %}80plus{% elif race.value_score >= 70 %}70plus{% elif race.value_score >= 60 %}60plus{% endif %}">
+                            {{ "%.0f"|format(race.value_score) }}★
+                        </span>
+                    </div>
+                    
+                    <div class="favorites-grid">
+                        <div class="favorite-card">
+                            <div class="favorite-name">🥇 {{ (race.favorite.name or 'Unknown') if race.favorite else 'N/A' }}</div>
+                            <div class="favorite-odds">{{ (race.favorite.odds_str or 'SP') if race.favorite else '' }}</div>
+                        </div>
+                        <div class="favorite-card">
+                            <div class="favorite-name">🥈 {{ (race.second_favorite.name or 'Unknown') if race.second_favorite else 'N/A' }}</div>
+                            <div class="favorite-odds">{{ (race.second_favorite.odds_str or 'SP') if race.second_favorite else '' }}</div>
+                        </div>
+                    </div>
+                    
+                    <div class="race-details">
+                        <div class="field-size">
+                            <strong>Field:</strong> {{ race.field_size }} runners
+                        </div>
+                        <div class="sources">
+                            {% for source in race.source_labels %}
+                                <span class="source-tag">{{ source }}</span>
+                            {% endfor %}
+                        </div>
+                    </div>
+                    
+                    <div class="action-buttons">
+                        <a href="{{ race.race_url }}" target="_blank" rel="noopener" class="btn btn-primary">
+                            📋 Racecard
+                        </a>
+                        {% if race.form_guide_url %}
+                            <a href="{{ race.form_guide_url }}" target="_blank" rel="noopener" class="btn btn-secondary">
+                                📊 Form
+                            </a>
+                        {% endif %}
+                    </div>
+                </div>
+            """
+
 # Mobile-optimized HTML template
 MOBILE_HTML_TEMPLATE = """
 <!doctype html>
@@ -486,57 +545,7 @@ MOBILE_HTML_TEMPLATE = """
     <div id="filtered-races" class="tab-content active">
         <h2>🎯 Superfecta Fields ({{ min_runners }}-{{ max_runners }} Runners)</h2>
         {% if filtered_races %}
-            {% for race in filtered_races %}
-                <div class="race {{ race.discipline }} value-{% if race.value_score >= 90 %}extreme{% elif race.value_score >= 80 %}high{% elif race.value_score >= 70 %}good{% else %}decent{% endif %}" data-score="{{ race.value_score }}">
-                    <div class="race-header">
-                        <div class="course-name">{{ race.course }}</div>
-                        <div class="discipline-icon">
-                            {% if race.discipline == 'thoroughbred' %}🐎{% elif race.discipline == 'harness' %}🏇{% elif race.discipline == 'greyhound' %}🐕{% endif %}
-                        </div>
-                    </div>
-                    
-                    <div class="race-meta">
-                        <span class="meta-pill">{{ race.country }}</span>
-                        <span class="meta-pill">{{ race.local_time }} {{ race.timezone_name }}</span>
-                        <span class="meta-pill value-score value-score-{% if race.value_score >= 90 %}90plus{% elif race.value_score >= 80 %}80plus{% elif race.value_score >= 70 %}70plus{% elif race.value_score >= 60 %}60plus{% endif %}">
-                            {{ "%.0f"|format(race.value_score) }}★
-                        </span>
-                    </div>
-                    
-                    <div class="favorites-grid">
-                        <div class="favorite-card">
-                            <div class="favorite-name">🥇 {{ (race.favorite.name or 'Unknown') if race.favorite else 'N/A' }}</div>
-                            <div class="favorite-odds">{{ (race.favorite.odds_str or 'SP') if race.favorite else '' }}</div>
-                        </div>
-                        <div class="favorite-card">
-                            <div class="favorite-name">🥈 {{ (race.second_favorite.name or 'Unknown') if race.second_favorite else 'N/A' }}</div>
-                            <div class="favorite-odds">{{ (race.second_favorite.odds_str or 'SP') if race.second_favorite else '' }}</div>
-                        </div>
-                    </div>
-                    
-                    <div class="race-details">
-                        <div class="field-size">
-                            <strong>Field:</strong> {{ race.field_size }} runners
-                        </div>
-                        <div class="sources">
-                            {% for source in race.data_sources.values() | unique | sort %}
-                                <span class="source-tag">{{ source.upper() }}</span>
-                            {% endfor %}
-                        </div>
-                    </div>
-                    
-                    <div class="action-buttons">
-                        <a href="{{ race.race_url }}" target="_blank" rel="noopener" class="btn btn-primary">
-                            📋 Racecard
-                        </a>
-                        {% if race.form_guide_url %}
-                            <a href="{{ race.form_guide_url }}" target="_blank" rel="noopener" class="btn btn-secondary">
-                                📊 Form
-                            </a>
-                        {% endif %}
-                    </div>
-                </div>
-            {% endfor %}
+            {% for race in filtered_races %}{{ render_race(race) }}{% endfor %}
         {% else %}
             <div class="empty-state">
                 <div class="empty-state-icon">🎯</div>
@@ -548,57 +557,7 @@ MOBILE_HTML_TEMPLATE = """
     <div id="value-races" class="tab-content">
         <h2>🔥 Premium Value Opportunities (Score 70+)</h2>
         {% if value_races %}
-            {% for race in value_races %}
-                <div class="race {{ race.discipline }} value-{% if race.value_score >= 90 %}extreme{% elif race.value_score >= 80 %}high{% elif race.value_score >= 70 %}good{% else %}decent{% endif %}" data-score="{{ race.value_score }}">
-                    <div class="race-header">
-                        <div class="course-name">{{ race.course }}</div>
-                        <div class="discipline-icon">
-                            {% if race.discipline == 'thoroughbred' %}🐎{% elif race.discipline == 'harness' %}🏇{% elif race.discipline == 'greyhound' %}🐕{% endif %}
-                        </div>
-                    </div>
-                    
-                    <div class="race-meta">
-                        <span class="meta-pill">{{ race.country }}</span>
-                        <span class="meta-pill">{{ race.local_time }} {{ race.timezone_name }}</span>
-                        <span class="meta-pill value-score value-score-{% if race.value_score >= 90 %}90plus{% elif race.value_score >= 80 %}80plus{% elif race.value_score >= 70 %}70plus{% elif race.value_score >= 60 %}60plus{% endif %}">
-                            {{ "%.0f"|format(race.value_score) }}★
-                        </span>
-                    </div>
-                    
-                    <div class="favorites-grid">
-                        <div class="favorite-card">
-                            <div class="favorite-name">🥇 {{ (race.favorite.name or 'Unknown') if race.favorite else 'N/A' }}</div>
-                            <div class="favorite-odds">{{ (race.favorite.odds_str or 'SP') if race.favorite else '' }}</div>
-                        </div>
-                        <div class="favorite-card">
-                            <div class="favorite-name">🥈 {{ (race.second_favorite.name or 'Unknown') if race.second_favorite else 'N/A' }}</div>
-                            <div class="favorite-odds">{{ (race.second_favorite.odds_str or 'SP') if race.second_favorite else '' }}</div>
-                        </div>
-                    </div>
-                    
-                    <div class="race-details">
-                        <div class="field-size">
-                            <strong>Field:</strong> {{ race.field_size }} runners
-                        </div>
-                        <div class="sources">
-                            {% for source in race.data_sources.values() | unique | sort %}
-                                <span class="source-tag">{{ source.upper() }}</span>
-                            {% endfor %}
-                        </div>
-                    </div>
-                    
-                    <div class="action-buttons">
-                        <a href="{{ race.race_url }}" target="_blank" rel="noopener" class="btn btn-primary">
-                            📋 Racecard
-                        </a>
-                        {% if race.form_guide_url %}
-                            <a href="{{ race.form_guide_url }}" target="_blank" rel="noopener" class="btn btn-secondary">
-                                📊 Form
-                            </a>
-                        {% endif %}
-                    </div>
-                </div>
-            {% endfor %}
+            {% for race in value_races %}{{ render_race(race) }}{% endfor %}
         {% else %}
             <div class="empty-state">
                 <div class="empty-state-icon">🔥</div>
@@ -610,57 +569,7 @@ MOBILE_HTML_TEMPLATE = """
     <div id="all-races" class="tab-content">
         <h2>📋 Complete Race List (by Score)</h2>
         {% if all_races %}
-            {% for race in all_races %}
-                <div class="race {{ race.discipline }} value-{% if race.value_score >= 90 %}extreme{% elif race.value_score >= 80 %}high{% elif race.value_score >= 70 %}good{% else %}decent{% endif %}" data-score="{{ race.value_score }}">
-                    <div class="race-header">
-                        <div class="course-name">{{ race.course }}</div>
-                        <div class="discipline-icon">
-                            {% if race.discipline == 'thoroughbred' %}🐎{% elif race.discipline == 'harness' %}🏇{% elif race.discipline == 'greyhound' %}🐕{% endif %}
-                        </div>
-                    </div>
-                    
-                    <div class="race-meta">
-                        <span class="meta-pill">{{ race.country }}</span>
-                        <span class="meta-pill">{{ race.local_time }} {{ race.timezone_name }}</span>
-                        <span class="meta-pill value-score value-score-{% if race.value_score >= 90 %}90plus{% elif race.value_score >= 80 %}80plus{% elif race.value_score >= 70 %}70plus{% elif race.value_score >= 60 %}60plus{% endif %}">
-                            {{ "%.0f"|format(race.value_score) }}★
-                        </span>
-                    </div>
-                    
-                    <div class="favorites-grid">
-                        <div class="favorite-card">
-                            <div class="favorite-name">🥇 {{ (race.favorite.name or 'Unknown') if race.favorite else 'N/A' }}</div>
-                            <div class="favorite-odds">{{ (race.favorite.odds_str or 'SP') if race.favorite else '' }}</div>
-                        </div>
-                        <div class="favorite-card">
-                            <div class="favorite-name">🥈 {{ (race.second_favorite.name or 'Unknown') if race.second_favorite else 'N/A' }}</div>
-                            <div class="favorite-odds">{{ (race.second_favorite.odds_str or 'SP') if race.second_favorite else '' }}</div>
-                        </div>
-                    </div>
-                    
-                    <div class="race-details">
-                        <div class="field-size">
-                            <strong>Field:</strong> {{ race.field_size }} runners
-                        </div>
-                        <div class="sources">
-                            {% for source in race.data_sources.values() | unique | sort %}
-                                <span class="source-tag">{{ source.upper() }}</span>
-                            {% endfor %}
-                        </div>
-                    </div>
-                    
-                    <div class="action-buttons">
-                        <a href="{{ race.race_url }}" target="_blank" rel="noopener" class="btn btn-primary">
-                            📋 Racecard
-                        </a>
-                        {% if race.form_guide_url %}
-                            <a href="{{ race.form_guide_url }}" target="_blank" rel="noopener" class="btn btn-secondary">
-                                📊 Form
-                            </a>
-                        {% endif %}
-                    </div>
-                </div>
-            {% endfor %}
+            {% for race in all_races %}{{ render_race(race) }}{% endfor %}
         {% else %}
             <div class="empty-state">
                 <div class="empty-state-icon">📋</div>
@@ -815,11 +724,11 @@ class MobileOutputManager(OutputManager):
     
     def write_html_report(self, races, stats, min_r, max_r):
         filename = self.out_dir / f"racing_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        template = self.jinja_env.from_string(HTML_TEMPLATE)
+        template = compile_template(HTML_TEMPLATE)
+        filtered_races, value_races = split_report_races(races, min_r, max_r)
         html = template.render(
-            config=CONFIG, stats=stats, all_races=races,
-            filtered_races=[r for r in races if min_r <= r.field_size <= max_r],
-            value_races=[r for r in races if r.value_score >= 70],
+            config=CONFIG, stats=stats, all_races=races, render_race=race_card_renderer(MOBILE_RACE_CARD_TEMPLATE),
+            filtered_races=filtered_races, value_races=value_races,
             generated_at=datetime.now().isoformat(timespec="seconds"),
             min_runners=min_r, max_runners=max_r
         )
@@ -828,16 +737,8 @@ class MobileOutputManager(OutputManager):
         logging.info(f"Mobile report saved to {filename}")
         return filename
 
-# Import datetime for the mobile output manager
-from datetime import datetime
-
 # Main function for mobile
 async def main_mobile_async(args):
-    import logging
-    import time
-    from datetime import timedelta
-    import asyncio
-    
     logging.basicConfig(
         level=logging.INFO if not args.verbose else logging.DEBUG,
         format="%(asctime)s - %(levelname)s - %(message)s",
@@ -870,7 +771,7 @@ async def main_mobile_async(args):
             print(f"📱 Mobile report saved to: {report_file}")
         
         if 'json' in args.formats:
-            output_manager.write_json_report(races, stats)
+            output_manager.write_json_report(races, stats, pretty=args.pretty)
         
         if 'csv' in args.formats:
             output_manager.write_csv_report(races)
@@ -890,13 +791,10 @@ async def main_mobile_async(args):
         logging.error(f"Critical error: {e}", exc_info=True)
         print(f"❌ Critical error occurred: {e}")
     finally:
-        await http_client.close()
+        await http_client.aclose()
 
 # Command line interface for mobile
 def main_mobile():
-    import argparse
-    import sys
-    
     parser = argparse.ArgumentParser(
         description=f"{CONFIG['APP_NAME']} Mobile Edition v{CONFIG['SCHEMA_VERSION']}",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -914,12 +812,13 @@ Mobile Examples:
     parser.add_argument("--max-field-size", type=int, default=CONFIG["FILTERS"]["MAX_FIELD_SIZE"])
     parser.add_argument("--interactive", action="store_true", help="Enable interactive fallback for manual HTML input")
     parser.add_argument("--formats", nargs='+', default=['html'], help="Output formats (html, json, csv)")
+    parser.add_argument("--pretty", action="store_true", help="Indent the JSON report (compact by default)")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose debug logging")
     
     args = parser.parse_args()
     
     try:
-        report_file = asyncio.run(main_mobile_async(args))
+        report_file = run_async(main_mobile_async(args))
         print("🎯 Mobile scan complete! Good luck with your bets! 🍀")
         if report_file:
             print(f"📱 Open the report in your mobile browser: {report_file}")